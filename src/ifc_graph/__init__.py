@@ -17,6 +17,7 @@ from .element_filter import (
     extract_property_sets,
     extract_spatial_hierarchy,
     extract_all_structures,
+    extract_structure_containment,
 )
 from .neo4j_store import (
     Neo4jConnection,
@@ -24,6 +25,11 @@ from .neo4j_store import (
     DatabaseOperationError,
     save_to_neo4j,
 )
+from .bulk_import import (
+    BulkImportError,
+    bulk_import,
+    write_import_csvs,
+)
 from .query_loader import QueryLoader, load_query
 
 __version__ = "0.1.3"
@@ -43,11 +49,16 @@ __all__ = [
     "extract_property_sets",
     "extract_spatial_hierarchy",
     "extract_all_structures",
+    "extract_structure_containment",
     # Neo4j Store
     "Neo4jConnection",
     "DatabaseConnectionError",
     "DatabaseOperationError",
     "save_to_neo4j",
+    # Bulk Import
+    "BulkImportError",
+    "bulk_import",
+    "write_import_csvs",
     # Query Loader
     "QueryLoader",
     "load_query",
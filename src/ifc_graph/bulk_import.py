@@ -0,0 +1,410 @@
+"""
+Bulk Import Module
+
+Writes IFC elements as neo4j-admin import CSV files and runs the offline
+importer for fast initial loads. The importer bypasses the transaction log,
+so it is far faster than Bolt writes, but it can only build a whole database
+and requires that database to be stopped.
+"""
+
+import logging
+import subprocess
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Optional
+
+from .element_filter import (
+    extract_all_structures,
+    extract_spatial_hierarchy,
+    extract_structure_containment,
+)
+from .neo4j_store import iter_element_rows
+
+logger = logging.getLogger(__name__)
+
+# PropertySet node keys that property set properties must not overwrite
+PSET_RESERVED_KEYS = {'id', 'name', 'import_id'}
+
+
+class BulkImportError(Exception):
+    """Raised when writing import files or running neo4j-admin fails."""
+    pass
+
+
+def _format_cell(value: Any) -> str:
+    """Format a value as a CSV cell; an empty cell means no property."""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return repr(value)
+    # Quote strings so empty strings are kept and commas/newlines are safe
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _column_type(values: Iterable[Any]) -> str:
+    """Infer the neo4j-admin column type from a column's values."""
+    values = [v for v in values if v is not None]
+    if not values:
+        return 'string'
+    if all(isinstance(v, bool) for v in values):
+        return 'boolean'
+    if any(isinstance(v, bool) for v in values):
+        return 'string'
+    if all(isinstance(v, int) for v in values):
+        return 'long'
+    if all(isinstance(v, (int, float)) for v in values):
+        return 'double'
+    return 'string'
+
+
+def _write_csv(path: Path, header: list[str], rows: Iterable[list]) -> None:
+    """Write a CSV file in the format neo4j-admin expects."""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        # Header names are only quoted when they contain CSV delimiters
+        f.write(','.join(
+            _format_cell(name) if any(c in name for c in ',"\n') else name
+            for name in header
+        ) + '\n')
+        for row in rows:
+            f.write(','.join(_format_cell(value) for value in row) + '\n')
+
+
+def _write_nodes(
+    path: Path,
+    id_space: str,
+    rows: list[dict],
+    id_key: str = 'id',
+    store_id: bool = True
+) -> None:
+    """
+    Write node rows, typing each property column from its values.
+    
+    Args:
+        path: Output CSV path
+        id_space: neo4j-admin ID space (one per label)
+        rows: Node property dictionaries
+        id_key: Key holding the unique import ID
+        store_id: Whether the import ID is also stored as a node property
+    
+    Raises:
+        BulkImportError: If a property name cannot be used as a column name
+    """
+    columns = []
+    for row in rows:
+        for key in row:
+            if key != id_key and key not in columns:
+                columns.append(key)
+    
+    # neo4j-admin reads everything after ':' in a header as the column type
+    invalid = [c for c in columns if ':' in c]
+    if invalid:
+        raise BulkImportError(f"Property names containing ':' cannot be imported: {invalid}")
+    
+    types = {c: _column_type(row.get(c) for row in rows) for c in columns}
+    
+    header = [f"{id_key}:ID({id_space})" if store_id else f":ID({id_space})"]
+    header.extend(c if types[c] == 'string' else f"{c}:{types[c]}" for c in columns)
+    
+    def cells(row: dict) -> list:
+        values = [row[id_key]]
+        for column in columns:
+            value = row.get(column)
+            # Columns mixing value types are written as strings
+            if value is not None and types[column] == 'string':
+                value = str(value)
+            values.append(value)
+        return values
+    
+    _write_csv(path, header, (cells(row) for row in rows))
+
+
+def _write_relationships(
+    path: Path,
+    start_space: str,
+    end_space: str,
+    pairs: Iterable[tuple[str, str]]
+) -> None:
+    """Write (start ID, end ID) relationship rows."""
+    header = [f":START_ID({start_space})", f":END_ID({end_space})"]
+    _write_csv(path, header, ([start, end] for start, end in pairs))
+
+
+def write_import_csvs(
+    filtered_elements: dict,
+    ifc_file: Any,
+    output_dir: str,
+    config: Optional[dict] = None
+) -> dict:
+    """
+    Write the filtered elements as neo4j-admin import CSV files.
+    
+    The files describe the same nodes and relationships that save_to_neo4j
+    creates over Bolt.
+    
+    Args:
+        filtered_elements: Dictionary of element type -> elements list
+        ifc_file: Loaded IFC file object
+        output_dir: Directory for the CSV files (created if missing)
+        config: Extraction configuration
+    
+    Returns:
+        Dictionary with 'nodes' and 'relationships' lists of (label or type, path)
+        tuples and 'stats' with import statistics
+    
+    Raises:
+        BulkImportError: If the files cannot be written
+    """
+    if config is None:
+        config = {
+            'include_materials': True,
+            'include_property_sets': True,
+            'max_properties_per_element': 50,
+        }
+    
+    start_time = time.time()
+    out = Path(output_dir)
+    
+    # Project node
+    project = ifc_file.by_type("IfcProject")[0]
+    project_id = str(project.id())
+    project_row = {
+        'id': project_id,
+        'name': getattr(project, 'Name', None) or 'Unnamed Project',
+        'type': 'IfcProject',
+        'description': getattr(project, 'Description', None) or '',
+        'phase': getattr(project, 'Phase', None) or '',
+    }
+    
+    # Spatial structures and hierarchy (merged by id as in the Bolt import)
+    structures = extract_all_structures(ifc_file)
+    structure_ids = {s['id'] for s in structures}
+    hierarchy = sorted({
+        (h['parent_id'], h['child_id'])
+        for h in extract_spatial_hierarchy(ifc_file)
+        if h['parent_id'] in structure_ids and h['child_id'] in structure_ids
+    })
+    
+    # Elements, materials and property sets
+    element_data = []
+    all_materials = []
+    all_property_sets = []
+    for rows, materials, psets in iter_element_rows(filtered_elements, config, ifc_file):
+        element_data.extend(rows)
+        all_materials.extend(materials)
+        all_property_sets.extend(psets)
+    
+    element_ids = {row['id'] for row in element_data}
+    containments = [
+        (c['structure_id'], c['element_id'])
+        for c in extract_structure_containment(ifc_file, element_ids)
+        if c['structure_id'] in structure_ids
+    ]
+    
+    # Materials are merged by id; every element link is kept
+    material_rows = {}
+    for mat in all_materials:
+        material_rows.setdefault(mat['material_id'], {
+            'id': mat['material_id'],
+            'name': mat['material_name'],
+            'category': mat['material_category'],
+        })
+    
+    # Each element gets its own PropertySet node, as in the Bolt import.
+    # Properties that would be read as typed columns or overwrite the node's
+    # own keys are left out.
+    pset_rows = []
+    skipped = set()
+    for pset in all_property_sets:
+        row = {}
+        for key, value in pset['properties'].items():
+            if ':' in key or key in PSET_RESERVED_KEYS:
+                skipped.add(key)
+            else:
+                row[key] = value
+        row['import_id'] = f"{pset['element_id']}:{pset['pset_id']}"
+        row['id'] = pset['pset_id']
+        row['name'] = pset['pset_name']
+        pset_rows.append(row)
+    
+    if skipped:
+        logger.warning(
+            f"Skipped property names that cannot be imported as columns: "
+            f"{', '.join(sorted(skipped))}"
+        )
+    
+    metadata_row = {
+        'import_id': 'metadata',
+        'timestamp': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'element_count': len(element_data),
+        'filtered_types': ", ".join(filtered_elements.keys()),
+        'source_file': str(ifc_file.header.file_name.name if hasattr(ifc_file, 'header') else 'Unknown'),
+        # The node is part of the import files, so only extraction time is known
+        'extraction_duration_seconds': round(time.time() - start_time, 2),
+    }
+    
+    files = {'nodes': [], 'relationships': []}
+    
+    node_files = [
+        ('Project', 'nodes_project', [project_row], {}),
+        ('Structure', 'nodes_structure', structures, {}),
+        ('Element', 'nodes_element', element_data, {}),
+        ('Material', 'nodes_material', list(material_rows.values()), {}),
+        ('PropertySet', 'nodes_property_set', pset_rows,
+         {'id_key': 'import_id', 'store_id': False}),
+        ('Metadata', 'nodes_metadata', [metadata_row],
+         {'id_key': 'import_id', 'store_id': False}),
+    ]
+    
+    relationship_files = [
+        ('CONTAINS', 'rels_project_contains', 'Project', 'Element',
+         [(project_id, row['id']) for row in element_data]),
+        ('CONTAINS', 'rels_structure_contains', 'Structure', 'Element',
+         containments),
+        ('AGGREGATES', 'rels_aggregates', 'Structure', 'Structure',
+         hierarchy),
+        ('HAS_MATERIAL', 'rels_has_material', 'Element', 'Material',
+         [(m['element_id'], m['material_id']) for m in all_materials]),
+        ('HAS_PROPERTY_SET', 'rels_has_property_set', 'Element', 'PropertySet',
+         [(p['element_id'], row['import_id'])
+          for p, row in zip(all_property_sets, pset_rows)]),
+    ]
+    
+    try:
+        out.mkdir(parents=True, exist_ok=True)
+        
+        for label, name, rows, options in node_files:
+            path = out / f"{name}.csv"
+            _write_nodes(path, label, rows, **options)
+            files['nodes'].append((label, path))
+        
+        for rel_type, name, start_space, end_space, pairs in relationship_files:
+            path = out / f"{name}.csv"
+            _write_relationships(path, start_space, end_space, pairs)
+            files['relationships'].append((rel_type, path))
+    
+    except OSError as e:
+        raise BulkImportError(f"Failed to write import files to {output_dir}: {e}") from e
+    
+    files['stats'] = {
+        'elements': len(element_data),
+        'structures': len(structures),
+        'materials': len(all_materials),
+        'property_sets': len(pset_rows),
+        'hierarchy_relations': len(hierarchy),
+    }
+    
+    logger.info(f"Wrote neo4j-admin import files for {len(element_data)} elements to {out}")
+    return files
+
+
+def build_import_command(
+    files: dict,
+    database: str = "neo4j",
+    neo4j_admin: str = "neo4j-admin",
+    overwrite: bool = False
+) -> list[str]:
+    """
+    Build the neo4j-admin (5.x) full import command for written CSV files.
+    
+    Args:
+        files: Result of write_import_csvs
+        database: Name of the database to create
+        neo4j_admin: Path to the neo4j-admin executable
+        overwrite: Whether to replace an existing database
+    
+    Returns:
+        Command as an argument list
+    """
+    command = [neo4j_admin, "database", "import", "full", "--multiline-fields=true"]
+    if overwrite:
+        command.append("--overwrite-destination=true")
+    command.extend(f"--nodes={label}={path}" for label, path in files['nodes'])
+    command.extend(
+        f"--relationships={rel_type}={path}" for rel_type, path in files['relationships']
+    )
+    command.append(database)
+    return command
+
+
+def run_admin_import(
+    files: dict,
+    database: str = "neo4j",
+    neo4j_admin: str = "neo4j-admin",
+    overwrite: bool = False
+) -> None:
+    """
+    Run neo4j-admin full import on written CSV files.
+    
+    The target database must be stopped. Without overwrite, neo4j-admin
+    refuses to replace a database that already exists.
+    
+    Args:
+        files: Result of write_import_csvs
+        database: Name of the database to create
+        neo4j_admin: Path to the neo4j-admin executable
+        overwrite: Whether to replace an existing database
+    
+    Raises:
+        BulkImportError: If neo4j-admin is missing or the import fails
+    """
+    command = build_import_command(files, database, neo4j_admin, overwrite)
+    logger.info(f"Running: {' '.join(command[:4])} ... {database}")
+    
+    try:
+        result = subprocess.run(command, capture_output=True, text=True)
+    except FileNotFoundError as e:
+        raise BulkImportError(
+            f"neo4j-admin not found: {neo4j_admin}. Set --neo4j-admin to its path"
+        ) from e
+    
+    if result.returncode != 0:
+        output = (result.stderr or result.stdout).strip()
+        raise BulkImportError(f"neo4j-admin import failed ({result.returncode}): {output}")
+    
+    logger.info(f"neo4j-admin import into '{database}' completed")
+
+
+def bulk_import(
+    filtered_elements: dict,
+    ifc_file: Any,
+    output_dir: str,
+    database: str = "neo4j",
+    neo4j_admin: str = "neo4j-admin",
+    overwrite: bool = False,
+    config: Optional[dict] = None
+) -> dict:
+    """
+    Load filtered IFC elements into a new database with neo4j-admin import.
+    
+    Use this for initial loads of large models; save_to_neo4j remains the
+    path for incremental imports into a running server. Id indexes are not
+    part of the import and are created by the next save_to_neo4j run.
+    
+    Args:
+        filtered_elements: Dictionary of element type -> elements list
+        ifc_file: Loaded IFC file object
+        output_dir: Directory for the CSV files
+        database: Name of the database to create
+        neo4j_admin: Path to the neo4j-admin executable
+        overwrite: Whether to replace an existing database
+        config: Extraction configuration
+    
+    Returns:
+        Dictionary with import statistics
+    
+    Raises:
+        BulkImportError: If writing files or the import fails
+    """
+    start_time = time.time()
+    
+    files = write_import_csvs(filtered_elements, ifc_file, output_dir, config)
+    run_admin_import(files, database, neo4j_admin, overwrite)
+    
+    logger.info(
+        f"Bulk imported {files['stats']['elements']} elements in "
+        f"{time.time() - start_time:.2f} seconds"
+    )
+    return files['stats']
@@ -25,6 +25,7 @@ from .neo4j_store import (
     DatabaseConnectionError,
     DatabaseOperationError,
 )
+from .bulk_import import bulk_import, BulkImportError
 
 # Module logger
 logger = logging.getLogger(__name__)
@@ -99,6 +100,7 @@ def get_default_config() -> dict:
             'include_materials': True,
             'include_geometry': False,
             'max_properties_per_element': 50,
+            'workers': 1,
         },
         'logging': {
             'level': 'INFO',
@@ -130,6 +132,7 @@ Examples:
   %(prog)s --clear-db                # Clear database before import
   %(prog)s --config custom.yaml      # Use custom configuration file
   %(prog)s --dry-run                 # Preview import without database changes
+  %(prog)s --bulk-import ./import    # Initial load via neo4j-admin (database stopped)
         """
     )
     
@@ -183,6 +186,28 @@ Examples:
         help='Parse IFC file and show what would be imported, but do not connect to database'
     )
     
+    parser.add_argument(
+        '--bulk-import',
+        type=str,
+        metavar='DIR',
+        help='Write neo4j-admin import CSVs to DIR and run an offline full import '
+             'into a stopped database (combine with --clear-db to replace existing data)'
+    )
+    
+    parser.add_argument(
+        '--neo4j-admin',
+        type=str,
+        default='neo4j-admin',
+        help='Path to the neo4j-admin executable used by --bulk-import (default: neo4j-admin)'
+    )
+    
+    parser.add_argument(
+        '--database',
+        type=str,
+        default='neo4j',
+        help='Name of the database created by --bulk-import (default: neo4j)'
+    )
+    
     parser.add_argument(
         '--version',
         action='version',
@@ -232,7 +257,8 @@ def main() -> int:
     neo4j_user = args.neo4j_user or os.getenv('NEO4J_USER')
     neo4j_password = args.neo4j_password or os.getenv('NEO4J_PASSWORD')
     
-    if not args.dry_run and not all([neo4j_uri, neo4j_user, neo4j_password]):
+    needs_connection = not (args.dry_run or args.bulk_import)
+    if needs_connection and not all([neo4j_uri, neo4j_user, neo4j_password]):
         logger.error("Missing Neo4j connection settings. Set NEO4J_URI, NEO4J_USER, and NEO4J_PASSWORD")
         return 1
     
@@ -268,16 +294,28 @@ def main() -> int:
         if args.clear_db:
             logger.warning("--clear-db flag set: All existing data will be deleted!")
         
-        # Save to Neo4j
-        stats = save_to_neo4j(
-            filtered_elements,
-            ifc_file,
-            neo4j_uri,
-            neo4j_user,
-            neo4j_password,
-            clear_db=args.clear_db,
-            config=extraction_config
-        )
+        if args.bulk_import:
+            # Initial load through neo4j-admin instead of Bolt writes
+            stats = bulk_import(
+                filtered_elements,
+                ifc_file,
+                args.bulk_import,
+                database=args.database,
+                neo4j_admin=args.neo4j_admin,
+                overwrite=args.clear_db,
+                config=extraction_config
+            )
+        else:
+            # Save to Neo4j
+            stats = save_to_neo4j(
+                filtered_elements,
+                ifc_file,
+                neo4j_uri,
+                neo4j_user,
+                neo4j_password,
+                clear_db=args.clear_db,
+                config=extraction_config
+            )
         
         logger.info("=" * 50)
         logger.info("Process completed successfully!")
@@ -305,6 +343,11 @@ def main() -> int:
         logger.error(f"Database operation failed: {e}")
         return 1
         
+    except BulkImportError as e:
+        logger.error(f"Bulk import failed: {e}")
+        logger.error("Check that neo4j-admin is installed and the target database is stopped")
+        return 1
+        
     except KeyboardInterrupt:
         logger.warning("Operation cancelled by user")
         return 1
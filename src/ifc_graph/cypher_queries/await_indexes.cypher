@@ -0,0 +1,2 @@
+// Wait until all indexes are ONLINE so the first batches can plan index lookups
+CALL db.awaitIndexes()
@@ -0,0 +1,2 @@
+// Index Element nodes by id so batch MATCH/MERGE lookups avoid label scans
+CREATE INDEX element_id_idx IF NOT EXISTS FOR (e:Element) ON (e.id)
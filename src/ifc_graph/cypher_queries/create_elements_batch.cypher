@@ -1,6 +1,9 @@
-// Batch create Element nodes from a list of elements
-// Parameters: $elements - list of element objects with properties (including quantities and key props)
+// Batch create Element nodes and link them to the project in one round-trip
+// Parameters: $project_id, $elements - list of element objects with properties (including quantities and key props)
 UNWIND $elements AS elem
 CREATE (e:Element)
 SET e += elem
+WITH e
+MATCH (p:Project {id: $project_id})
+CREATE (p)-[:CONTAINS]->(e)
 RETURN count(e) AS created_count
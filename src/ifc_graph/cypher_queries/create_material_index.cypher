@@ -0,0 +1,2 @@
+// Index Material nodes by id so batch MATCH/MERGE lookups avoid label scans
+CREATE INDEX material_id_idx IF NOT EXISTS FOR (m:Material) ON (m.id)
@@ -0,0 +1,2 @@
+// Index Project nodes by id so batch MATCH/MERGE lookups avoid label scans
+CREATE INDEX project_id_idx IF NOT EXISTS FOR (p:Project) ON (p.id)
@@ -0,0 +1,2 @@
+// Index Structure nodes by id so batch MATCH/MERGE lookups avoid label scans
+CREATE INDEX structure_id_idx IF NOT EXISTS FOR (s:Structure) ON (s.id)
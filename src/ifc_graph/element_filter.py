@@ -149,6 +149,42 @@ def load_ifc_file(file_path: str) -> ifcopenshell.file:
         raise IFCLoadError(f"Failed to load IFC file: {file_path}. Error: {e}") from e
 
 
+def _probe_get_info_cpp() -> Optional[Any]:
+    """
+    Return ifcopenshell's C++ attribute reader if it supports flat reads.
+    
+    entity.get_info() only routes recursive reads through it, so flat reads
+    call it directly. Older releases' reader takes the entity only.
+    """
+    get_info_cpp = getattr(ifcopenshell.ifcopenshell_wrapper, 'get_info_cpp', None)
+    if get_info_cpp is None:
+        return None
+    try:
+        probe = ifcopenshell.file(schema='IFC4').createIfcWall()
+        info = get_info_cpp(probe, False, True)
+    except Exception:
+        return None
+    return get_info_cpp if 'id' in info and 'type' in info else None
+
+
+_get_info_cpp = _probe_get_info_cpp()
+
+
+def _get_info(entity: Any) -> dict[str, Any]:
+    """
+    Read the direct attributes used for Element nodes, plus 'id' and 'type'.
+    
+    Uses a single C++ call when available; referenced entities are returned
+    as-is rather than expanded. Otherwise reads the attributes one by one.
+    """
+    if _get_info_cpp is not None:
+        return _get_info_cpp(entity, False, True)
+    info = {'id': entity.id(), 'type': entity.is_a()}
+    for name in ('Name', 'GlobalId', 'ObjectType', 'Description', 'Tag'):
+        info[name] = getattr(entity, name, None)
+    return info
+
+
 def extract_element_properties(element: Any, config: dict) -> dict[str, Any]:
     """
     Extract properties from an IFC element for graph storage.
@@ -161,14 +197,15 @@ def extract_element_properties(element: Any, config: dict) -> dict[str, Any]:
     Returns:
         Dictionary of extracted properties
     """
+    info = _get_info(element)
     props = {
-        'id': str(element.id()),
-        'name': getattr(element, 'Name', None) or 'Unnamed',
-        'guid': getattr(element, 'GlobalId', '') or '',
-        'type': element.is_a(),
-        'object_type': getattr(element, 'ObjectType', None) or '',
-        'description': getattr(element, 'Description', None) or '',
-        'tag': getattr(element, 'Tag', None) or '',
+        'id': str(info['id']),
+        'name': info.get('Name') or 'Unnamed',
+        'guid': info.get('GlobalId') or '',
+        'type': info['type'],
+        'object_type': info.get('ObjectType') or '',
+        'description': info.get('Description') or '',
+        'tag': info.get('Tag') or '',
     }
     
     # For IfcSpace, also extract LongName
@@ -190,17 +227,13 @@ def _extract_key_properties(element: Any) -> dict[str, Any]:
     """Extract commonly-queried properties directly from property sets."""
     props = {}
     try:
-        if not hasattr(element, 'IsDefinedBy'):
-            return props
-        for definition in element.IsDefinedBy:
+        for definition in getattr(element, 'IsDefinedBy', None) or ():
             if not definition.is_a('IfcRelDefinesByProperties'):
                 continue
             prop_def = definition.RelatingPropertyDefinition
             if not prop_def.is_a('IfcPropertySet'):
                 continue
-            if not hasattr(prop_def, 'HasProperties'):
-                continue
-            for prop in prop_def.HasProperties:
+            for prop in getattr(prop_def, 'HasProperties', None) or ():
                 if prop.Name in KEY_PROPERTIES:
                     value = _get_property_value(prop)
                     if value is not None:
@@ -226,17 +259,13 @@ def _extract_quantities(element: Any) -> dict[str, Any]:
         return quantities
     
     try:
-        if not hasattr(element, 'IsDefinedBy'):
-            return quantities
-        for definition in element.IsDefinedBy:
+        for definition in getattr(element, 'IsDefinedBy', None) or ():
             if not definition.is_a('IfcRelDefinesByProperties'):
                 continue
             prop_def = definition.RelatingPropertyDefinition
             if not prop_def.is_a('IfcElementQuantity'):
                 continue
-            if not hasattr(prop_def, 'Quantities'):
-                continue
-            for qty in prop_def.Quantities:
+            for qty in getattr(prop_def, 'Quantities', None) or ():
                 if qty.Name not in relevant_quantities:
                     continue
                 value = _get_quantity_value(qty)
@@ -278,28 +307,68 @@ def extract_spatial_info(element: Any) -> list[dict]:
     spatial_info = []
     
     try:
-        if hasattr(element, 'ContainedInStructure') and element.ContainedInStructure:
-            for rel in element.ContainedInStructure:
-                if rel.RelatingStructure:
-                    structure = rel.RelatingStructure
-                    spatial_info.append({
-                        'id': str(structure.id()),
-                        'name': getattr(structure, 'Name', None) or 'Unnamed',
-                        'type': structure.is_a(),
-                        'long_name': getattr(structure, 'LongName', None) or '',
-                        'elevation': _get_elevation(structure),
-                    })
+        for rel in getattr(element, 'ContainedInStructure', None) or ():
+            if rel.RelatingStructure:
+                structure = rel.RelatingStructure
+                spatial_info.append({
+                    'id': str(structure.id()),
+                    'name': getattr(structure, 'Name', None) or 'Unnamed',
+                    'type': structure.is_a(),
+                    'long_name': getattr(structure, 'LongName', None) or '',
+                    'elevation': _get_elevation(structure),
+                })
     except Exception as e:
         logger.debug(f"Error extracting spatial info for element {element.id()}: {e}")
     
     return spatial_info
 
 
+def extract_structure_containment(
+    ifc_file,
+    element_ids: Optional[set[str]] = None
+) -> list[dict]:
+    """
+    Extract structure->element containment from IfcRelContainedInSpatialStructure.
+    
+    Walks the containment relationships once instead of resolving the
+    ContainedInStructure inverse attribute on every element.
+    
+    Args:
+        ifc_file: Loaded IFC file object
+        element_ids: Optional set of element IDs to keep; others are skipped
+    
+    Returns:
+        List of dicts with structure_id and element_id
+    """
+    containments = []
+    
+    try:
+        for rel in ifc_file.by_type('IfcRelContainedInSpatialStructure'):
+            structure = rel.RelatingStructure
+            if structure is None:
+                continue
+            
+            structure_id = str(structure.id())
+            for element in (rel.RelatedElements or []):
+                element_id = str(element.id())
+                if element_ids is not None and element_id not in element_ids:
+                    continue
+                containments.append({
+                    'structure_id': structure_id,
+                    'element_id': element_id,
+                })
+    except Exception as e:
+        logger.debug(f"Error extracting structure containment: {e}")
+    
+    return containments
+
+
 def _get_elevation(structure) -> Optional[float]:
     """Get elevation of a spatial structure if available."""
     try:
-        if hasattr(structure, 'Elevation') and structure.Elevation is not None:
-            return float(structure.Elevation)
+        elevation = getattr(structure, 'Elevation', None)
+        if elevation is not None:
+            return float(elevation)
     except (TypeError, ValueError):
         pass
     return None
@@ -389,11 +458,10 @@ def extract_material_info(element: Any) -> list[dict]:
     materials = []
     
     try:
-        if hasattr(element, 'HasAssociations'):
-            for association in element.HasAssociations:
-                if association.is_a('IfcRelAssociatesMaterial'):
-                    material_select = association.RelatingMaterial
-                    materials.extend(_process_material(material_select, element))
+        for association in getattr(element, 'HasAssociations', None) or ():
+            if association.is_a('IfcRelAssociatesMaterial'):
+                material_select = association.RelatingMaterial
+                materials.extend(_process_material(material_select, element))
     except Exception as e:
         logger.debug(f"Error extracting materials for element {element.id()}: {e}")
     
@@ -420,15 +488,14 @@ def _process_material(material_select, element) -> list[dict]:
         # Material layer set
         elif material_select.is_a('IfcMaterialLayerSetUsage'):
             layer_set = material_select.ForLayerSet
-            if layer_set and hasattr(layer_set, 'MaterialLayers'):
-                for layer in layer_set.MaterialLayers:
-                    if layer.Material:
-                        materials.append({
-                            'element_id': str(element.id()),
-                            'material_id': str(layer.Material.id()),
-                            'material_name': getattr(layer.Material, 'Name', '') or '',
-                            'material_category': getattr(layer.Material, 'Category', '') or '',
-                        })
+            for layer in getattr(layer_set, 'MaterialLayers', None) or ():
+                if layer.Material:
+                    materials.append({
+                        'element_id': str(element.id()),
+                        'material_id': str(layer.Material.id()),
+                        'material_name': getattr(layer.Material, 'Name', '') or '',
+                        'material_category': getattr(layer.Material, 'Category', '') or '',
+                    })
         
         # Material list
         elif material_select.is_a('IfcMaterialList'):
@@ -460,35 +527,33 @@ def extract_property_sets(element: Any, max_properties: int = 50) -> list[dict]:
     total_props = 0
     
     try:
-        if hasattr(element, 'IsDefinedBy'):
-            for definition in element.IsDefinedBy:
-                if total_props >= max_properties:
-                    break
-                    
-                if definition.is_a('IfcRelDefinesByProperties'):
-                    prop_def = definition.RelatingPropertyDefinition
+        for definition in getattr(element, 'IsDefinedBy', None) or ():
+            if total_props >= max_properties:
+                break
+                
+            if definition.is_a('IfcRelDefinesByProperties'):
+                prop_def = definition.RelatingPropertyDefinition
+                
+                if prop_def.is_a('IfcPropertySet'):
+                    pset_data = {
+                        'element_id': str(element.id()),
+                        'pset_id': str(prop_def.id()),
+                        'pset_name': prop_def.Name or 'Unnamed',
+                        'properties': {}
+                    }
                     
-                    if prop_def.is_a('IfcPropertySet'):
-                        pset_data = {
-                            'element_id': str(element.id()),
-                            'pset_id': str(prop_def.id()),
-                            'pset_name': prop_def.Name or 'Unnamed',
-                            'properties': {}
-                        }
+                    for prop in getattr(prop_def, 'HasProperties', None) or ():
+                        if total_props >= max_properties:
+                            break
                         
-                        if hasattr(prop_def, 'HasProperties'):
-                            for prop in prop_def.HasProperties:
-                                if total_props >= max_properties:
-                                    break
-                                
-                                prop_value = _get_property_value(prop)
-                                if prop_value is not None:
-                                    pset_data['properties'][prop.Name] = prop_value
-                                    total_props += 1
+                        prop_value = _get_property_value(prop)
+                        if prop_value is not None:
+                            pset_data['properties'][prop.Name] = prop_value
+                            total_props += 1
+                    
+                    if pset_data['properties']:
+                        property_sets.append(pset_data)
                         
-                        if pset_data['properties']:
-                            property_sets.append(pset_data)
-                            
     except Exception as e:
         logger.debug(f"Error extracting property sets for element {element.id()}: {e}")
     
@@ -560,15 +625,32 @@ def filter_physical_elements(
     # Dictionary to store elements by type
     filtered_elements = {}
     
+    # by_type() is an indexed lookup that includes subtypes, so overlapping
+    # types (e.g. IfcWall and IfcWallStandardCase) return the same entities.
+    # Bucket each entity once, under its own class when that was requested.
+    requested_types = set(element_types)
+    seen_ids = set()
+    
     # Filter elements
     for element_type in element_types:
         try:
             elements = ifc_file.by_type(element_type)
-            if elements:
-                filtered_elements[element_type] = elements
-                logger.info(f"Found {len(elements)} {element_type} elements")
         except Exception as e:
             logger.warning(f"Error filtering {element_type}: {e}")
+            continue
+        
+        for element in elements:
+            element_id = element.id()
+            if element_id in seen_ids:
+                continue
+            seen_ids.add(element_id)
+            
+            entity_type = element.is_a()
+            bucket = entity_type if entity_type in requested_types else element_type
+            filtered_elements.setdefault(bucket, []).append(element)
+    
+    for element_type, elements in filtered_elements.items():
+        logger.info(f"Found {len(elements)} {element_type} elements")
     
     load_time = time.time() - start_time
     total_elements = sum(len(elems) for elems in filtered_elements.values())
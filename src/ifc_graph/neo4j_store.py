@@ -6,9 +6,13 @@ Includes robust error handling and connection management.
 """
 
 import logging
+import multiprocessing
+import sys
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 
 from neo4j import GraphDatabase
 from neo4j.exceptions import (
@@ -20,15 +24,33 @@ from neo4j.exceptions import (
 from .query_loader import load_query
 from .element_filter import (
     extract_element_properties,
-    extract_spatial_info,
     extract_material_info,
     extract_property_sets,
     extract_spatial_hierarchy,
     extract_all_structures,
+    extract_structure_containment,
 )
 
 logger = logging.getLogger(__name__)
 
+# Rows sent per UNWIND statement; each batch is a single Bolt round-trip
+DEFAULT_BATCH_SIZE = 5000
+
+# Rows written per explicit transaction before committing
+DEFAULT_TRANSACTION_SIZE = 10000
+
+# IFC file and config inherited by forked extraction workers
+_worker_ifc_file = None
+_worker_config = None
+
+# Index queries for the node labels that batch queries MATCH or MERGE by id
+INDEX_QUERIES = (
+    "create_project_index",
+    "create_element_index",
+    "create_structure_index",
+    "create_material_index",
+)
+
 
 class DatabaseConnectionError(Exception):
     """Raised when there's an error connecting to the database."""
@@ -130,6 +152,58 @@ class Neo4jConnection:
         self.close()
 
 
+def _run_batches(
+    session,
+    query: str,
+    param_name: str,
+    rows: list,
+    batch_size: int,
+    transaction_size: int = DEFAULT_TRANSACTION_SIZE,
+    **params
+) -> None:
+    """
+    Run a batch query over rows inside explicit transactions.
+    
+    Batches are grouped into one transaction until roughly transaction_size
+    rows have been written, then committed, so the server flushes its
+    transaction log once per group rather than once per statement.
+    
+    Args:
+        session: Neo4j session
+        query: Cypher query taking the batch as a list parameter
+        param_name: Name of the list parameter in the query
+        rows: Rows to write
+        batch_size: Number of rows per statement
+        transaction_size: Number of rows per transaction
+        **params: Additional query parameters shared by every batch
+    """
+    if not rows:
+        return
+    
+    tx = None
+    pending = 0
+    try:
+        for i in range(0, len(rows), batch_size):
+            # Opened lazily so no empty transaction is committed at the end
+            if tx is None:
+                tx = session.begin_transaction()
+            batch = rows[i:i + batch_size]
+            tx.run(query, **params, **{param_name: batch})
+            pending += len(batch)
+            logger.debug(f"Wrote {param_name} batch {i // batch_size + 1}")
+            if pending >= transaction_size:
+                tx.commit()
+                tx.close()
+                tx = None
+                pending = 0
+        if tx is not None:
+            tx.commit()
+    finally:
+        # Rolls back if the transaction was not committed
+        if tx is not None:
+            tx.close()
+
+
 def clear_database(session) -> None:
     """
     Clear all nodes and relationships from the database.
@@ -143,6 +217,22 @@ def clear_database(session) -> None:
     logger.info("Database cleared")
 
 
+def create_indexes(session) -> None:
+    """
+    Create id indexes used by the batch MATCH/MERGE queries.
+    
+    Waits for the indexes to come online, since batches planned while an
+    index is still populating fall back to label scans.
+    
+    Args:
+        session: Neo4j session
+    """
+    for query_name in INDEX_QUERIES:
+        session.run(load_query(query_name))
+    session.run(load_query("await_indexes")).consume()
+    logger.info(f"Ensured {len(INDEX_QUERIES)} id indexes")
+
+
 def create_project_node(session, project) -> str:
     """
     Create the project node in the database.
@@ -169,41 +259,29 @@ def create_project_node(session, project) -> str:
     return project_id
 
 
-def batch_create_elements(
-    session,
+def extract_element_rows(
     elements: list,
-    config: dict,
-    batch_size: int = 500
-) -> tuple[int, list[dict], list[dict], list[dict]]:
+    config: dict
+) -> tuple[list[dict], list[dict], list[dict]]:
     """
-    Batch create element nodes with properties.
+    Extract element, material and property set rows for batch writing.
     
     Args:
-        session: Neo4j session
         elements: List of IFC elements
         config: Extraction configuration
-        batch_size: Number of elements per batch
     
     Returns:
-        Tuple of (element count, spatial info list, materials list, property sets list)
+        Tuple of (element data list, materials list, property sets list)
     """
     all_element_data = []
-    all_spatial_info = []
     all_materials = []
     all_property_sets = []
     
-    # Extract data from all elements
     for element in elements:
         # Basic properties
         elem_data = extract_element_properties(element, config)
         all_element_data.append(elem_data)
         
-        # Spatial containment
-        spatial_info = extract_spatial_info(element)
-        for info in spatial_info:
-            info['element_id'] = elem_data['id']
-        all_spatial_info.extend(spatial_info)
-        
         # Materials
         if config.get('include_materials', True):
             materials = extract_material_info(element)
@@ -215,18 +293,132 @@ def batch_create_elements(
             psets = extract_property_sets(element, max_props)
             all_property_sets.extend(psets)
     
-    # Batch insert elements
+    return all_element_data, all_materials, all_property_sets
+
+
+def _extract_rows_worker(element_ids: list[int]) -> tuple[list[dict], list[dict], list[dict]]:
+    """Extract rows in a forked worker, looking elements up by step id."""
+    elements = [_worker_ifc_file.by_id(element_id) for element_id in element_ids]
+    return extract_element_rows(elements, _worker_config)
+
+
+def iter_element_rows(
+    filtered_elements: dict,
+    config: dict,
+    ifc_file: Any = None,
+    chunk_size: int = DEFAULT_TRANSACTION_SIZE
+) -> Iterator[tuple[list[dict], list[dict], list[dict]]]:
+    """
+    Yield extracted rows for all elements, one chunk at a time, in order.
+    
+    When config['workers'] is greater than 1 and ifc_file is given, chunks are
+    extracted in parallel by forked worker processes. ifcopenshell entities
+    cannot be pickled, so workers inherit the loaded file and receive element
+    ids only. Fork is only safe on Linux (macOS system libraries may crash in
+    forked children), so other platforms fall back to serial extraction.
+    
+    Args:
+        filtered_elements: Dictionary of element type -> elements list
+        config: Extraction configuration
+        ifc_file: Loaded IFC file object (required for parallel extraction)
+        chunk_size: Number of elements per chunk
+    
+    Yields:
+        Tuple of (element data list, materials list, property sets list)
+    """
+    global _worker_ifc_file, _worker_config
+    
+    chunks = []
+    for element_type, elements in filtered_elements.items():
+        logger.info(f"Processing {len(elements)} {element_type} elements...")
+        for i in range(0, len(elements), chunk_size):
+            chunks.append(elements[i:i + chunk_size])
+    
+    workers = int(config.get('workers') or 1)
+    if workers > 1 and ifc_file is not None and len(chunks) > 1:
+        if sys.platform.startswith('linux'):
+            _worker_ifc_file, _worker_config = ifc_file, config
+            try:
+                with multiprocessing.get_context('fork').Pool(workers) as pool:
+                    chunk_ids = ([element.id() for element in chunk] for chunk in chunks)
+                    yield from pool.imap(_extract_rows_worker, chunk_ids)
+                return
+            finally:
+                _worker_ifc_file = _worker_config = None
+        logger.warning("Parallel extraction is only supported on Linux; extracting serially")
+    
+    for chunk in chunks:
+        yield extract_element_rows(chunk, config)
+
+
+def pipeline_create_elements(
+    session,
+    filtered_elements: dict,
+    config: dict,
+    project_id: str,
+    ifc_file: Any = None,
+    chunk_size: int = DEFAULT_TRANSACTION_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> tuple[int, set[str], list[dict], list[dict]]:
+    """
+    Create element nodes for all types, overlapping extraction with writes.
+    
+    Elements are processed in chunks. A single writer thread owns the session
+    and writes chunk N while the calling thread extracts rows for chunk N+1,
+    so Python-side extraction runs while the server commits. Extraction
+    itself can be spread over worker processes (see iter_element_rows).
+    
+    Args:
+        session: Neo4j session (used only by the writer thread until return)
+        filtered_elements: Dictionary of element type -> elements list
+        config: Extraction configuration
+        project_id: Project node ID the elements belong to
+        ifc_file: Loaded IFC file object (enables parallel extraction)
+        chunk_size: Number of elements extracted and written per chunk
+        batch_size: Number of elements per batch
+    
+    Returns:
+        Tuple of (element count, element ID set, materials list, property sets list)
+    """
     query = load_query("create_elements_batch")
+    element_count = 0
+    element_ids = set()
+    all_materials = []
+    all_property_sets = []
     
-    for i in range(0, len(all_element_data), batch_size):
-        batch = all_element_data[i:i + batch_size]
-        session.run(query, elements=batch)
-        logger.debug(f"Created element batch {i // batch_size + 1}")
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        pending_write = None
+        
+        rows = iter_element_rows(filtered_elements, config, ifc_file, chunk_size)
+        try:
+            for element_data, materials, psets in rows:
+                # Surface write errors before queueing more work
+                if pending_write is not None:
+                    pending_write.result()
+                pending_write = writer.submit(
+                    _run_batches, session, query, 'elements', element_data, batch_size,
+                    project_id=project_id,
+                )
+                
+                element_count += len(element_data)
+                element_ids.update(row['id'] for row in element_data)
+                all_materials.extend(materials)
+                all_property_sets.extend(psets)
+            
+            if pending_write is not None:
+                pending_write.result()
+        finally:
+            # Shuts down extraction workers if a write failed mid-way
+            rows.close()
     
-    return len(all_element_data), all_spatial_info, all_materials, all_property_sets
+    return element_count, element_ids, all_materials, all_property_sets
 
 
-def batch_create_structures(session, spatial_info: list[dict], batch_size: int = 500) -> int:
+def batch_create_structures(
+    session,
+    spatial_info: list[dict],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
     """
     Batch create or merge structure nodes.
     
@@ -260,15 +452,17 @@ def batch_create_structures(session, spatial_info: list[dict], batch_size: int =
     structures = list(unique_structures.values())
     query = load_query("create_structures_batch")
     
-    for i in range(0, len(structures), batch_size):
-        batch = structures[i:i + batch_size]
-        session.run(query, structures=batch)
+    _run_batches(session, query, 'structures', structures, batch_size)
     
     logger.info(f"Created {len(structures)} structure nodes")
     return len(structures)
 
 
-def batch_create_all_structures(session, ifc_file, batch_size: int = 500) -> int:
+def batch_create_all_structures(
+    session,
+    ifc_file,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
     """
     Create all spatial structure nodes from IFC file.
     
@@ -285,15 +479,17 @@ def batch_create_all_structures(session, ifc_file, batch_size: int = 500) -> int
         return 0
     
     query = load_query("create_structures_batch")
-    for i in range(0, len(structures), batch_size):
-        batch = structures[i:i + batch_size]
-        session.run(query, structures=batch)
+    _run_batches(session, query, 'structures', structures, batch_size)
     
     logger.info(f"Created {len(structures)} spatial structure nodes")
     return len(structures)
 
 
-def batch_create_spatial_hierarchy(session, ifc_file, batch_size: int = 500) -> int:
+def batch_create_spatial_hierarchy(
+    session,
+    ifc_file,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
     """
     Create AGGREGATES relationships for spatial hierarchy.
     
@@ -310,65 +506,31 @@ def batch_create_spatial_hierarchy(session, ifc_file, batch_size: int = 500) ->
         return 0
     
     query = load_query("create_aggregates_batch")
-    for i in range(0, len(hierarchy), batch_size):
-        batch = hierarchy[i:i + batch_size]
-        session.run(query, aggregates=batch)
+    _run_batches(session, query, 'aggregates', hierarchy, batch_size)
     
     logger.info(f"Created {len(hierarchy)} spatial hierarchy relationships")
     return len(hierarchy)
 
 
-def batch_create_project_relationships(
-    session,
-    project_id: str,
-    element_ids: list[str],
-    batch_size: int = 500
-) -> None:
-    """
-    Batch create CONTAINS relationships from project to elements.
-    
-    Args:
-        session: Neo4j session
-        project_id: Project node ID
-        element_ids: List of element IDs
-        batch_size: Number of relationships per batch
-    """
-    query = load_query("create_project_contains")
-    
-    for i in range(0, len(element_ids), batch_size):
-        batch = element_ids[i:i + batch_size]
-        session.run(query, project_id=project_id, element_ids=batch)
-    
-    logger.debug(f"Created {len(element_ids)} project->element relationships")
-
-
 def batch_create_structure_relationships(
     session,
-    spatial_info: list[dict],
-    batch_size: int = 500
+    containments: list[dict],
+    batch_size: int = DEFAULT_BATCH_SIZE
 ) -> None:
     """
     Batch create CONTAINS relationships from structures to elements.
     
     Args:
         session: Neo4j session
-        spatial_info: List of spatial info with element_id and structure id
+        containments: List of {structure_id, element_id} dictionaries
         batch_size: Number of relationships per batch
     """
-    if not spatial_info:
+    if not containments:
         return
     
-    containments = [
-        {'structure_id': info['id'], 'element_id': info['element_id']}
-        for info in spatial_info
-        if 'element_id' in info
-    ]
-    
     query = load_query("create_structure_contains")
     
-    for i in range(0, len(containments), batch_size):
-        batch = containments[i:i + batch_size]
-        session.run(query, containments=batch)
+    _run_batches(session, query, 'containments', containments, batch_size)
     
     logger.debug(f"Created {len(containments)} structure->element relationships")
 
@@ -376,7 +538,7 @@ def batch_create_structure_relationships(
 def batch_create_materials(
     session,
     materials: list[dict],
-    batch_size: int = 500
+    batch_size: int = DEFAULT_BATCH_SIZE
 ) -> int:
     """
     Batch create material nodes and relationships.
@@ -394,9 +556,7 @@ def batch_create_materials(
     
     query = load_query("create_materials_batch")
     
-    for i in range(0, len(materials), batch_size):
-        batch = materials[i:i + batch_size]
-        session.run(query, materials=batch)
+    _run_batches(session, query, 'materials', materials, batch_size)
     
     logger.info(f"Created {len(materials)} material relationships")
     return len(materials)
@@ -425,7 +585,7 @@ def create_metadata(session, data: dict) -> None:
 def batch_create_property_sets(
     session,
     property_sets: list[dict],
-    batch_size: int = 500
+    batch_size: int = DEFAULT_BATCH_SIZE
 ) -> int:
     """
     Batch create PropertySet nodes and HAS_PROPERTY_SET relationships.
@@ -442,9 +602,7 @@ def batch_create_property_sets(
         return 0
     
     query = load_query("create_property_sets_batch")
-    for i in range(0, len(property_sets), batch_size):
-        batch = property_sets[i:i + batch_size]
-        session.run(query, property_sets=batch)
+    _run_batches(session, query, 'property_sets', property_sets, batch_size)
     
     logger.info(f"Created {len(property_sets)} property set nodes")
     return len(property_sets)
@@ -453,11 +611,12 @@ def batch_create_property_sets(
 def save_to_neo4j(
     filtered_elements: dict,
     ifc_file: Any,
-    uri: str,
-    username: str,
-    password: str,
+    uri: Optional[str] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
     clear_db: bool = False,
-    config: Optional[dict] = None
+    config: Optional[dict] = None,
+    connection: Optional[Neo4jConnection] = None
 ) -> dict:
     """
     Saves filtered IFC elements to Neo4j database using batch operations.
@@ -465,19 +624,27 @@ def save_to_neo4j(
     Args:
         filtered_elements: Dictionary of element type -> elements list
         ifc_file: Loaded IFC file object
-        uri: Neo4j connection URI
-        username: Neo4j username
-        password: Neo4j password
+        uri: Neo4j connection URI (required unless connection is given)
+        username: Neo4j username (required unless connection is given)
+        password: Neo4j password (required unless connection is given)
         clear_db: Whether to clear the database before import (default: False)
         config: Extraction configuration
+        connection: Optional open Neo4jConnection to reuse across imports.
+            When given, uri/username/password are ignored and the connection
+            is left open for the caller to close.
     
     Returns:
         Dictionary with import statistics
     
     Raises:
-        DatabaseConnectionError: If connection fails
+        DatabaseConnectionError: If connection fails or no connection details are given
         DatabaseOperationError: If database operations fail
     """
+    if connection is None and (uri is None or username is None or password is None):
+        raise DatabaseConnectionError(
+            "save_to_neo4j needs either uri, username and password or an open connection"
+        )
+    
     if config is None:
         config = {
             'include_materials': True,
@@ -495,12 +662,20 @@ def save_to_neo4j(
     }
     
     try:
-        with Neo4jConnection(uri, username, password) as conn:
+        if connection is not None:
+            conn_context = nullcontext(connection)
+        else:
+            conn_context = Neo4jConnection(uri, username, password)
+        
+        with conn_context as conn:
             with conn.session() as session:
                 # Optionally clear database
                 if clear_db:
                     clear_database(session)
                 
+                # Index ids before any batch MATCHes elements or structures
+                create_indexes(session)
+                
                 # Create project node
                 project = ifc_file.by_type("IfcProject")[0]
                 project_id = create_project_node(session, project)
@@ -511,33 +686,19 @@ def save_to_neo4j(
                 # Create spatial hierarchy (AGGREGATES relationships)
                 stats['hierarchy_relations'] = batch_create_spatial_hierarchy(session, ifc_file)
                 
-                # Process all elements
-                all_spatial_info = []
-                all_materials = []
-                all_property_sets = []
-                all_element_ids = []
-                
-                for element_type, elements in filtered_elements.items():
-                    logger.info(f"Processing {len(elements)} {element_type} elements...")
-                    
-                    count, spatial, materials, psets = batch_create_elements(
-                        session, elements, config
-                    )
-                    
-                    stats['elements'] += count
-                    all_spatial_info.extend(spatial)
-                    all_materials.extend(materials)
-                    all_property_sets.extend(psets)
-                    
-                    # Collect element IDs for project relationships
-                    for elem in elements:
-                        all_element_ids.append(str(elem.id()))
-                
-                # Create relationships
-                batch_create_project_relationships(session, project_id, all_element_ids)
+                # Process all elements (project CONTAINS links are created with the nodes)
+                (
+                    stats['elements'],
+                    all_element_ids,
+                    all_materials,
+                    all_property_sets,
+                ) = pipeline_create_elements(
+                    session, filtered_elements, config, project_id, ifc_file
+                )
                 
                 # Create structure->element containment relationships
-                batch_create_structure_relationships(session, all_spatial_info)
+                containments = extract_structure_containment(ifc_file, all_element_ids)
+                batch_create_structure_relationships(session, containments)
                 
                 # Create materials
                 stats['materials'] = batch_create_materials(session, all_materials)
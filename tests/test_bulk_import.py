@@ -0,0 +1,122 @@
+"""Tests for the neo4j-admin CSV writer and command builder."""
+
+from pathlib import Path
+
+import pytest
+
+from ifc_graph.bulk_import import (
+    BulkImportError,
+    _column_type,
+    _format_cell,
+    _write_nodes,
+    build_import_command,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, ''),
+        (True, 'true'),
+        (False, 'false'),
+        (3, '3'),
+        (2.5, '2.5'),
+        ('', '""'),
+        ('plain', '"plain"'),
+        ('say "hi", twice\nok', '"say ""hi"", twice\nok"'),
+    ],
+)
+def test_format_cell(value, expected):
+    assert _format_cell(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        ([], 'string'),
+        ([None, None], 'string'),
+        ([True, False, None], 'boolean'),
+        ([True, 1], 'string'),
+        ([1, 2, None], 'long'),
+        ([1, 2.5], 'double'),
+        ([1, 'a'], 'string'),
+    ],
+)
+def test_column_type(values, expected):
+    assert _column_type(values) == expected
+
+
+def _read_lines(path: Path) -> list[str]:
+    return path.read_text(encoding='utf-8').splitlines()
+
+
+def test_write_nodes_sparse_columns(tmp_path):
+    path = tmp_path / "nodes.csv"
+    rows = [
+        {'id': '1', 'name': 'Wall', 'LoadBearing': True},
+        {'id': '2', 'name': 'Door', 'Width': 900},
+        {'id': '3', 'name': 'Slab', 'Width': 0.25},
+    ]
+    
+    _write_nodes(path, 'Element', rows)
+    
+    assert _read_lines(path) == [
+        'id:ID(Element),name,LoadBearing:boolean,Width:double',
+        '"1","Wall",true,',
+        '"2","Door",,900',
+        '"3","Slab",,0.25',
+    ]
+
+
+def test_write_nodes_mixed_column_written_as_strings(tmp_path):
+    path = tmp_path / "nodes.csv"
+    rows = [{'id': '1', 'Rating': 30}, {'id': '2', 'Rating': 'F60'}]
+    
+    _write_nodes(path, 'Element', rows)
+    
+    assert _read_lines(path) == ['id:ID(Element),Rating', '"1","30"', '"2","F60"']
+
+
+def test_write_nodes_without_stored_id(tmp_path):
+    path = tmp_path / "nodes.csv"
+    rows = [{'import_id': '9:12', 'id': '12', 'name': 'Pset_WallCommon'}]
+    
+    _write_nodes(path, 'PropertySet', rows, id_key='import_id', store_id=False)
+    
+    assert _read_lines(path) == [
+        ':ID(PropertySet),id,name',
+        '"9:12","12","Pset_WallCommon"',
+    ]
+
+
+def test_write_nodes_rejects_colon_in_property_name(tmp_path):
+    rows = [{'id': '1', 'Width:mm': 900}]
+    
+    with pytest.raises(BulkImportError):
+        _write_nodes(tmp_path / "nodes.csv", 'Element', rows)
+
+
+def test_build_import_command():
+    files = {
+        'nodes': [('Project', Path('p.csv')), ('Element', Path('e.csv'))],
+        'relationships': [('CONTAINS', Path('c.csv'))],
+    }
+    
+    command = build_import_command(files, database='model', neo4j_admin='/opt/neo4j-admin')
+    
+    assert command == [
+        '/opt/neo4j-admin', 'database', 'import', 'full', '--multiline-fields=true',
+        '--nodes=Project=p.csv',
+        '--nodes=Element=e.csv',
+        '--relationships=CONTAINS=c.csv',
+        'model',
+    ]
+
+
+def test_build_import_command_overwrite():
+    files = {'nodes': [], 'relationships': []}
+    
+    command = build_import_command(files, overwrite=True)
+    
+    assert '--overwrite-destination=true' in command
+    assert command[-1] == 'neo4j'